@@ -6,6 +6,7 @@ Author: Harsh Kumar
 
 from __future__ import annotations
 
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -13,7 +14,7 @@ from pathlib import Path
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """
     Global configuration for API tests.
@@ -21,9 +22,16 @@ class Config:
     # Base URL of the API under test (using reqres.in as public mock API)
     base_url: str = "https://reqres.in/api"
 
+    # User-Agent sent with every request (set once on the HTTP session)
+    user_agent: str = "API-Testing-Automation-Suite/1.0"
+
     # Request timeout in seconds
     timeout: float = 10.0
 
+    # Number of test cases executed concurrently; also sizes the HTTP
+    # connection pool so every worker thread gets a reusable connection
+    max_workers: int = 8
+
     # Maximum allowed response time in milliseconds for performance checks
     max_response_time_ms: float = 800.0
 
@@ -32,9 +40,13 @@ class Config:
     reports_dir: Path = BASE_DIR / "reports"
 
 
+@functools.lru_cache(maxsize=1)
 def get_config() -> Config:
     """
     Factory function so it’s easy to extend later (e.g. env-based configs).
+
+    Memoised: every caller shares one `Config` and the log/report
+    directories are only created on the first call.
     """
     cfg = Config()
     cfg.logs_dir.mkdir(parents=True, exist_ok=True)
@@ -13,17 +13,30 @@ from __future__ import annotations
 
 import json
 import logging
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from .config import Config
-from .http_client import HttpClient
+
+if TYPE_CHECKING:
+    from .http_client import HttpClient
+
+try:  # optional C decoder; the stdlib parser is used when it's absent
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# Both decode straight from the raw response bytes; their errors subclass ValueError
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# A JSON path as a tuple of keys, e.g. ("data", "id") for payload["data"]["id"]
+JsonPath = Tuple[str, ...]
 
-@dataclass
+
+@dataclass(slots=True)
 class TestResult:
     """
     Represents the outcome of a single API test.
@@ -33,6 +46,8 @@ class TestResult:
     status_code: Optional[int] = None
     response_time_ms: Optional[float] = None
     details: str = ""
+    # Decoded JSON body of the response (None if absent or not JSON)
+    payload: Any = None
 
 
 class APITestSuite:
@@ -54,13 +69,17 @@ class APITestSuite:
         name: str,
         path: str,
         expected_status: int,
-        required_json_paths: Optional[List[str]] = None,
+        required_json_paths: Optional[Sequence[JsonPath]] = None,
+        index: Optional[int] = None,
     ) -> TestResult:
         """
         Execute a GET request and validate:
         - status code
         - JSON structure (required paths)
         - response time
+
+        The result is appended to `self.results`, or stored at `index` if
+        given (a slot pre-allocated by the caller for concurrent runs).
         """
         logger.info("Running GET test: %s", name)
         try:
@@ -79,7 +98,7 @@ class APITestSuite:
                 details=f"Exception while executing test: {exc}",
             )
 
-        self.results.append(result)
+        self._store_result(result, index)
         self._log_result(result)
         return result
 
@@ -89,13 +108,17 @@ class APITestSuite:
         path: str,
         payload: Dict[str, Any],
         expected_status: int,
-        required_json_paths: Optional[List[str]] = None,
+        required_json_paths: Optional[Sequence[JsonPath]] = None,
+        index: Optional[int] = None,
     ) -> TestResult:
         """
         Execute a POST request and validate:
         - status code
         - JSON structure (required paths)
         - response time
+
+        The result is appended to `self.results`, or stored at `index` if
+        given (a slot pre-allocated by the caller for concurrent runs).
         """
         logger.info("Running POST test: %s", name)
         try:
@@ -114,7 +137,7 @@ class APITestSuite:
                 details=f"Exception while executing test: {exc}",
             )
 
-        self.results.append(result)
+        self._store_result(result, index)
         self._log_result(result)
         return result
 
@@ -127,7 +150,7 @@ class APITestSuite:
         name: str,
         response,
         expected_status: int,
-        required_json_paths: Optional[List[str]] = None,
+        required_json_paths: Optional[Sequence[JsonPath]] = None,
     ) -> TestResult:
         """
         Perform core validations on a response:
@@ -136,67 +159,83 @@ class APITestSuite:
         - basic JSON schema/structure check via key paths
         """
         status_code = response.status_code
-        elapsed_ms = response.elapsed.total_seconds() * 1000
+        elapsed_ms = getattr(response, "elapsed_ms", None)
+        if elapsed_ms is None:  # response not issued through HttpClient
+            elapsed_ms = response.elapsed.total_seconds() * 1000
 
-        details_list: List[str] = []
-        success = True
+        # Only allocated once a check fails; the passing path builds nothing
+        failures: Optional[List[str]] = None
 
         # Status code check
         if status_code != expected_status:
-            success = False
-            details_list.append(
+            failures = failures or []
+            failures.append(
                 f"Expected status {expected_status}, got {status_code}."
             )
 
         # Response time check
         if elapsed_ms > self.config.max_response_time_ms:
-            success = False
-            details_list.append(
+            failures = failures or []
+            failures.append(
                 f"Response time {elapsed_ms:.2f} ms exceeded "
                 f"limit {self.config.max_response_time_ms:.2f} ms."
             )
 
+        # Decode the body once; the parsed payload is kept on the result
+        try:
+            payload: Any = _json_loads(response.content)
+            is_json = True
+        except ValueError:
+            payload = None
+            is_json = False
+
         # JSON structure validation
         if required_json_paths:
-            try:
-                payload = response.json()
-            except json.JSONDecodeError:
-                success = False
-                details_list.append("Response is not valid JSON.")
+            if not is_json:
+                failures = failures or []
+                failures.append("Response is not valid JSON.")
             else:
                 for path in required_json_paths:
                     if not self._has_json_path(payload, path):
-                        success = False
-                        details_list.append(f"Missing JSON path: {path}")
-
-        if not details_list:
-            details_list.append("All checks passed.")
+                        failures = failures or []
+                        failures.append(f"Missing JSON path: {'.'.join(path)}")
 
         return TestResult(
             name=name,
-            success=success,
+            success=failures is None,
             status_code=status_code,
             response_time_ms=elapsed_ms,
-            details=" ".join(details_list),
+            details=" ".join(failures) if failures else "All checks passed.",
+            payload=payload,
         )
 
+    def _store_result(self, result: TestResult, index: Optional[int]) -> None:
+        """
+        Record a result. Concurrent callers each write their own
+        pre-allocated slot, so no lock is needed.
+        """
+        if index is None:
+            self.results.append(result)
+        else:
+            self.results[index] = result
+
     @staticmethod
-    def _has_json_path(payload: Any, path: str) -> bool:
+    def _has_json_path(payload: Any, path: JsonPath) -> bool:
         """
-        Check whether a dotted JSON path exists in the response.
+        Check whether a JSON path (tuple of keys) exists in the response.
 
         Example:
-            path="data.id" checks payload["data"]["id"]
+            path=("data", "id") checks payload["data"]["id"]
 
         If any key is missing, returns False.
         """
-        parts = path.split(".")
         current: Any = payload
-
-        for part in parts:
-            if not isinstance(current, dict) or part not in current:
-                return False
-            current = current[part]
+        try:
+            for part in path:
+                current = current[part]
+        except (KeyError, TypeError):
+            # KeyError: missing key; TypeError: hit a list/scalar mid-path
+            return False
         return True
 
     def _log_result(self, result: TestResult) -> None:
@@ -220,17 +259,30 @@ class APITestSuite:
         Kept simple for clarity; can be replaced later with JUnit/HTML output.
         """
         logger.info("Writing test report to %s", path)
-        lines: List[str] = []
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8", buffering=1 << 16) as fh:
+            fh.writelines(f"{line}\n" for line in self._iter_report_lines())
+
+    def write_json_report(self, path: Path) -> None:
+        """
+        Write all test results as a JSON array of objects, one per result,
+        using the `TestResult` field names as keys.
+        """
+        logger.info("Writing JSON test report to %s", path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8", buffering=1 << 16) as fh:
+            json.dump([asdict(res) for res in self.results], fh, indent=2)
+
+    def _iter_report_lines(self) -> Iterator[str]:
+        """
+        Yield one formatted report line per test result.
+        """
         for res in self.results:
             status_str = "PASS" if res.success else "FAIL"
             response_time_str = f"{res.response_time_ms:.2f}" if res.response_time_ms else "N/A"
-            line = (
+            yield (
                 f"{status_str} | {res.name} | "
                 f"status={res.status_code} | "
                 f"time={response_time_str} ms | "
                 f"{res.details}"
             )
-            lines.append(line)
-
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text("\n".join(lines), encoding="utf-8")
@@ -2,7 +2,7 @@
 HTTP client wrapper around the `requests` library.
 
 Responsible for:
-- Issuing HTTP requests
+- Issuing HTTP requests over a pooled, keep-alive session
 - Applying timeouts
 - Basic error handling and logging
 
@@ -12,12 +12,14 @@ Author: Harsh Kumar
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Optional
-
-import requests  # type: ignore
+import time
+from typing import TYPE_CHECKING, Any, Dict, Optional
 
 from .config import Config
 
+if TYPE_CHECKING:
+    import requests  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,23 +30,67 @@ class APIClientError(RuntimeError):
 class HttpClient:
     """
     Thin wrapper over `requests` to centralise logging and error handling.
+
+    A single `requests.Session` is reused for all calls so that connections
+    to `base_url` are kept alive and pooled instead of re-established (TCP +
+    TLS handshake) for every test. Use as a context manager, or call
+    `close()`, to release the pool.
+
+    Returned responses carry an extra `elapsed_ms` attribute: wall time of
+    the call in milliseconds, measured with `time.perf_counter_ns()`.
     """
 
     def __init__(self, config: Config) -> None:
+        # Imported lazily: `requests` pulls in urllib3, charset-normalizer,
+        # idna and certifi, which are only needed once a client exists.
+        import requests  # type: ignore
+        from requests.adapters import HTTPAdapter  # type: ignore
+        from urllib3.util.retry import Retry  # type: ignore
+
         self.config = config
+        self._requests = requests
+
+        self.session = requests.Session()
+        self.session.headers["User-Agent"] = config.user_agent
+
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=config.max_workers,
+            max_retries=Retry(
+                total=2,
+                backoff_factor=0.2,
+                status_forcelist=[502, 503, 504],
+                raise_on_status=False,  # hand the final response to the validators
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def __enter__(self) -> "HttpClient":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the underlying session and release pooled connections.
+        """
+        self.session.close()
 
     def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> requests.Response:
         """
         Perform a GET request to `base_url + path`.
         """
         url = self._build_url(path)
-        logger.info("GET %s params=%s", url, params)
+        logger.debug("GET %s params=%s", url, params)
+        start_ns = time.perf_counter_ns()
         try:
-            headers = {"User-Agent": "API-Testing-Automation-Suite/1.0"}
-            response = requests.get(url, params=params, timeout=self.config.timeout, headers=headers)
-        except requests.RequestException as exc:  # network/connection errors
+            response = self.session.get(url, params=params, timeout=self.config.timeout)
+        except self._requests.RequestException as exc:  # network/connection errors
             logger.exception("GET request failed: %s", exc)
             raise APIClientError(str(exc)) from exc
+        response.elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
         return response
 
     def post(self, path: str, json: Optional[Dict[str, Any]] = None) -> requests.Response:
@@ -52,13 +98,14 @@ class HttpClient:
         Perform a POST request to `base_url + path`.
         """
         url = self._build_url(path)
-        logger.info("POST %s json=%s", url, json)
+        logger.debug("POST %s json=%s", url, json)
+        start_ns = time.perf_counter_ns()
         try:
-            headers = {"User-Agent": "API-Testing-Automation-Suite/1.0"}
-            response = requests.post(url, json=json, timeout=self.config.timeout, headers=headers)
-        except requests.RequestException as exc:
+            response = self.session.post(url, json=json, timeout=self.config.timeout)
+        except self._requests.RequestException as exc:
             logger.exception("POST request failed: %s", exc)
             raise APIClientError(str(exc)) from exc
+        response.elapsed_ms = (time.perf_counter_ns() - start_ns) / 1e6
         return response
 
     def _build_url(self, path: str) -> str:
@@ -9,58 +9,58 @@ Author: Harsh Kumar
 
 from __future__ import annotations
 
-from typing import List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Tuple
 
 from .core_tester import APITestSuite, TestResult
 
 
-def run_all_tests(suite: APITestSuite) -> List[TestResult]:
-    """
-    Register and run all test cases using the given APITestSuite.
-    Returns a list of TestResult objects.
-    """
-
-    results: List[TestResult] = []
-
+# Each case is a (method, kwargs) pair; kwargs are passed straight to
+# `APITestSuite.run_get_test` / `APITestSuite.run_post_test`.
+# JSON paths are pre-split key tuples, e.g. ("data", "id") for data.id.
+TEST_CASES: List[Tuple[str, Dict[str, Any]]] = [
     # ------------------------------------------------------------------ #
     # GET tests
     # ------------------------------------------------------------------ #
 
     # Example: GET /users/2 -> expect a single user object
-    results.append(
-        suite.run_get_test(
+    (
+        "GET",
+        dict(
             name="GET single user (id=2)",
             path="/users/2",
             expected_status=200,
-            required_json_paths=[
-                "data.id",
-                "data.email",
-                "data.first_name",
-                "data.last_name",
-            ],
-        )
-    )
+            required_json_paths=(
+                ("data", "id"),
+                ("data", "email"),
+                ("data", "first_name"),
+                ("data", "last_name"),
+            ),
+        ),
+    ),
 
     # Example: GET /users?page=2 -> expect list
-    results.append(
-        suite.run_get_test(
+    (
+        "GET",
+        dict(
             name="GET users list (page=2)",
             path="/users?page=2",
             expected_status=200,
-            required_json_paths=[
-                "page",
-                "data",  # ensure `data` list field exists
-            ],
-        )
-    )
+            required_json_paths=(
+                ("page",),
+                ("data",),  # ensure `data` list field exists
+            ),
+        ),
+    ),
 
     # ------------------------------------------------------------------ #
     # POST tests
     # ------------------------------------------------------------------ #
 
     # Example: POST /users -> create user
-    results.append(
-        suite.run_post_test(
+    (
+        "POST",
+        dict(
             name="POST create user",
             path="/users",
             payload={
@@ -68,28 +68,54 @@ def run_all_tests(suite: APITestSuite) -> List[TestResult]:
                 "job": "automation-tester",
             },
             expected_status=201,
-            required_json_paths=[
-                "name",
-                "job",
-                "id",
-                "createdAt",
-            ],
-        )
-    )
+            required_json_paths=(
+                ("name",),
+                ("job",),
+                ("id",),
+                ("createdAt",),
+            ),
+        ),
+    ),
 
     # Example: POST /login with missing password (should fail with 400)
-    results.append(
-        suite.run_post_test(
+    (
+        "POST",
+        dict(
             name="POST login without password (negative test)",
             path="/login",
             payload={
                 "email": "peter@klaven",
             },
             expected_status=400,
-            required_json_paths=[
-                "error",
-            ],
-        )
-    )
+            required_json_paths=(
+                ("error",),
+            ),
+        ),
+    ),
+]
+
+
+def run_all_tests(suite: APITestSuite) -> List[TestResult]:
+    """
+    Run all registered test cases using the given APITestSuite.
+    Returns a list of TestResult objects, in registration order.
+
+    The cases are independent and network-bound, so they are executed
+    concurrently on a thread pool; wall time is roughly that of the
+    slowest single request rather than the sum of all of them.
+    """
+    runners = {
+        "GET": suite.run_get_test,
+        "POST": suite.run_post_test,
+    }
+
+    # One slot per case: workers write by index, keeping registration order
+    offset = len(suite.results)
+    suite.results.extend([None] * len(TEST_CASES))  # type: ignore[list-item]
 
-    return results
+    with ThreadPoolExecutor(max_workers=min(suite.config.max_workers, len(TEST_CASES))) as executor:
+        futures = [
+            executor.submit(runners[method], index=offset + i, **kwargs)
+            for i, (method, kwargs) in enumerate(TEST_CASES)
+        ]
+        return [future.result() for future in futures]
@@ -5,7 +5,7 @@ Test runner script for the API Testing Automation Suite.
 - Instantiates Config + HttpClient + APITestSuite
 - Runs all defined test cases
 - Prints a clean console summary
-- Writes a text report to the reports/ directory
+- Writes text and JSON reports to the reports/ directory
 
 Author: Harsh Kumar
 """
@@ -13,39 +13,52 @@ Author: Harsh Kumar
 from __future__ import annotations
 
 import logging
+import sys
 from datetime import datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from api_tests.config import get_config
-from api_tests.core_tester import APITestSuite, TestResult
-from api_tests.http_client import HttpClient
-from api_tests.test_cases import run_all_tests
+
+if TYPE_CHECKING:
+    from api_tests.core_tester import TestResult
+
+LOG_FORMATTER = logging.Formatter(
+    fmt="[%(asctime)s] [%(levelname)s] %(name)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
 
 
 def setup_logging(logs_dir: Path) -> None:
     """
     Configure logging to both console and file.
     """
+    import logging.handlers  # only needed once logging is configured
+
     logs_dir.mkdir(parents=True, exist_ok=True)
     log_file = logs_dir / "api_tests.log"
 
-    formatter = logging.Formatter(
-        fmt="[%(asctime)s] [%(levelname)s] %(name)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.INFO)
-
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    console_handler.setFormatter(LOG_FORMATTER)
 
-    # File handler
+    # File handler, batched: records are buffered and written in bulk
+    # (flushed early on ERROR, and on interpreter shutdown)
     file_handler = logging.FileHandler(log_file, encoding="utf-8")
-    file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+    file_handler.setFormatter(LOG_FORMATTER)
+    buffered_file_handler = logging.handlers.MemoryHandler(
+        capacity=512,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+    )
+
+    # Install both at once; `force` drops handlers from any earlier call
+    # so calling this twice does not duplicate every log line
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[console_handler, buffered_file_handler],
+        force=True,
+    )
 
 
 def print_summary(results: list[TestResult]) -> None:
@@ -56,41 +69,54 @@ def print_summary(results: list[TestResult]) -> None:
     passed = sum(1 for r in results if r.success)
     failed = total - passed
 
-    print("\n" + "=" * 60)
-    print("API TEST SUMMARY".center(60))
-    print("=" * 60)
+    lines = [
+        "",
+        "=" * 60,
+        "API TEST SUMMARY".center(60),
+        "=" * 60,
+    ]
     for res in results:
         status = "PASS" if res.success else "FAIL"
         response_time_str = f"{res.response_time_ms:.2f}" if res.response_time_ms else "N/A"
-        print(
+        lines.append(
             f"{status:<5} | {res.name:<40} "
             f"| status={res.status_code} "
             f"| time={response_time_str} ms"
         )
-    print("-" * 60)
-    print(f"Total: {total} | Passed: {passed} | Failed: {failed}")
-    print("=" * 60 + "\n")
+    lines.append("-" * 60)
+    lines.append(f"Total: {total} | Passed: {passed} | Failed: {failed}")
+    lines.append("=" * 60)
+    lines.append("\n")
+
+    # Single write instead of one print() per line
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.flush()
 
 
 def main() -> None:
     """
     Main entry point. Wires everything together.
     """
+    # Deferred so importing this module (e.g. for `print_summary`) stays cheap
+    from api_tests.core_tester import APITestSuite
+    from api_tests.http_client import HttpClient
+    from api_tests.test_cases import run_all_tests
+
     config = get_config()
     setup_logging(config.logs_dir)
 
     logger = logging.getLogger(__name__)
     logger.info("Starting API Testing Automation Suite")
 
-    client = HttpClient(config)
-    suite = APITestSuite(config, client)
-
-    results = run_all_tests(suite)
+    with HttpClient(config) as client:
+        suite = APITestSuite(config, client)
+        results = run_all_tests(suite)
 
-    # Write report to file
+    # Write reports to file
     timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
     report_path = config.reports_dir / f"api_test_report_{timestamp}.txt"
     suite.write_report(report_path)
+    suite.write_json_report(report_path.with_suffix(".json"))
 
     print_summary(results)
     logger.info("API Testing Automation Suite finished. Report: %s", report_path)